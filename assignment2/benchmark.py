@@ -0,0 +1,154 @@
+"""
+Benchmarks for all the problems in this assignment. Run from the repository root:
+
+    python -m assignment2.benchmark [--quick] [--profile DIR] [--output FILE]
+
+Each benchmark prints its results. --output writes all the results to a JSON file, so that runs of different versions can be compared. --profile writes the cProfile output of each benchmark to DIR/<benchmark>.prof, which can be read with pstats or snakeviz.
+"""
+import argparse
+import contextlib
+import cProfile
+import io
+import json
+import os
+import platform
+import random
+import string
+import timeit
+from datetime import datetime, timezone
+
+from . import problem_1, problem_2, problem_3, problem_4, problem_5, problem_6
+
+TEST_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "problem_2_testdir")
+
+def _rate(count, statement, repeat=3):
+    """
+    Returns count divided by the best time of running statement once, out of repeat runs.
+    """
+    return count / min(timeit.repeat(statement, number=1, repeat=repeat))
+
+def benchmark_lru(operations):
+    cache = problem_1.LRU_Cache(1000)
+    keys = [random.randrange(2000) for _ in range(operations)]
+
+    def set_all():
+        for key in keys:
+            cache.set(key, key)
+
+    def get_all():
+        for key in keys:
+            cache.get(key)
+
+    return {"set ops/sec": _rate(operations, set_all), "get ops/sec": _rate(operations, get_all)}
+
+def benchmark_find_files(walks):
+    def walk_all():
+        for _ in range(walks):
+            problem_2.find_files("c", TEST_DIR)
+
+    return {"walks/sec": _rate(walks, walk_all)}
+
+def benchmark_huffman(text_size):
+    text = "".join(random.choices(string.ascii_letters + " ", k=text_size))
+    root, leaf_nodes = problem_3.build_huffman_tree(text)
+    encoded = problem_3.encode(text, leaf_nodes)
+    megabytes = len(text.encode("utf-8")) / 1_000_000
+
+    return {
+        "encode MB/s": _rate(megabytes, lambda: problem_3.encode(text, leaf_nodes)),
+        "decode MB/s": _rate(megabytes, lambda: problem_3.decode(encoded, root)),
+    }
+
+def benchmark_membership(checks):
+    # A chain of nested groups with the user only in the innermost one is the worst case for is_user_in_group
+    root = group = problem_4.Group("group 0")
+    for depth in range(1, 50):
+        subgroup = problem_4.Group(f"group {depth}")
+        group.add_group(subgroup)
+        group = subgroup
+    group.add_user("user")
+
+    def check_group():
+        for _ in range(checks):
+            problem_4.is_user_in_group("user", root)
+
+    llist = problem_6.LinkedListSet.from_iterable(range(checks))
+
+    def check_list():
+        for value in range(checks):
+            value in llist
+
+    return {"nested group checks/sec": _rate(checks, check_group), "LinkedListSet checks/sec": _rate(checks, check_list)}
+
+def benchmark_chain_validation(block_count):
+    return problem_5.benchmark_validation(block_count)
+
+def benchmark_chain_ingest(block_count):
+    return problem_5.benchmark_ingest(block_count)
+
+def benchmark_set_algebra(large_size):
+    return problem_6.benchmark_set_algebra(large_size, ratios=(1, 100, large_size))
+
+def benchmark_set_ingest(largest_size):
+    sizes = [size for size in (1_000, 10_000, 100_000, 1_000_000, 10_000_000) if size <= largest_size]
+    return problem_6.benchmark_from_iterable(sizes)
+
+# Benchmark name -> (function, argument for a full run, argument for a quick run)
+BENCHMARKS = {
+    "lru": (benchmark_lru, 1_000_000, 10_000),
+    "find_files": (benchmark_find_files, 1_000, 10),
+    "huffman": (benchmark_huffman, 1_000_000, 10_000),
+    "membership": (benchmark_membership, 100_000, 1_000),
+    "chain_validation": (benchmark_chain_validation, 200_000, 2_000),
+    "chain_ingest": (benchmark_chain_ingest, 200_000, 2_000),
+    "set_algebra": (benchmark_set_algebra, 1_000_000, 10_000),
+    "set_ingest": (benchmark_set_ingest, 10_000_000, 10_000),
+}
+
+def run(names, quick=False, profile_dir=None):
+    results = dict()
+    for name in names:
+        function, full_argument, quick_argument = BENCHMARKS[name]
+        print(f"---------{name}---------")
+        profiler = cProfile.Profile() if profile_dir else None
+        if profiler:
+            profiler.enable()
+        # Some benchmarks come from the problem files and print their own results. They are printed below in one format instead.
+        with contextlib.redirect_stdout(io.StringIO()):
+            results[name] = function(quick_argument if quick else full_argument)
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(os.path.join(profile_dir, f"{name}.prof"))
+
+        for metric, value in results[name].items():
+            print(f"{metric}: {value:,.4f}")
+    return results
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Benchmark the problems in assignment2.")
+    parser.add_argument("names", nargs="*", metavar="NAME", help=f"benchmarks to run, all by default. One of: {', '.join(BENCHMARKS)}")
+    parser.add_argument("--quick", action="store_true", help="use small inputs, for a smoke test")
+    parser.add_argument("--profile", metavar="DIR", help="write cProfile output of each benchmark to DIR")
+    parser.add_argument("--output", metavar="FILE", help="write the results to FILE as JSON")
+    options = parser.parse_args(args)
+    unknown_names = [name for name in options.names if name not in BENCHMARKS]
+    if unknown_names:
+        parser.error(f"unknown benchmarks: {', '.join(unknown_names)}")
+
+    if options.profile:
+        os.makedirs(options.profile, exist_ok=True)
+    results = run(options.names or list(BENCHMARKS), options.quick, options.profile)
+
+    if options.output:
+        with open(options.output, "w") as output_file:
+            json.dump({
+                "created": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "quick": options.quick,
+                "results": results,
+            }, output_file, indent=2)
+    return results
+
+if __name__ == "__main__":
+    main()
@@ -312,8 +312,9 @@ def test_case_5():
     test(our_cache.get(2), -1)
 
 
-test_case_1()
-test_case_2()
-test_case_3()
-test_case_4()
-test_case_5()
\ No newline at end of file
+if __name__ == "__main__":
+    test_case_1()
+    test_case_2()
+    test_case_3()
+    test_case_4()
+    test_case_5()
\ No newline at end of file
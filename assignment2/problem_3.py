@@ -173,9 +173,10 @@ def test(input, expected_encoding, debug=False):
         print(f"Compression: {100 - (bits_after_compression / bits_before_compression) * 100}%")
 
 
-test("AAAAAAABBBCCCCCCCDDEEEEEE", "1010101010101000100100111111111111111000000010101010101")
-test("AAABBC", "000111110")
-test("A", "0")
-test("AB", "01")
-test("", "")
-test("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "0110001101011100111110000100011001010011101001010110110101111100011001110101101111100111011111011111000000010010001101000101")
\ No newline at end of file
+if __name__ == "__main__":
+    test("AAAAAAABBBCCCCCCCDDEEEEEE", "1010101010101000100100111111111111111000000010101010101")
+    test("AAABBC", "000111110")
+    test("A", "0")
+    test("AB", "01")
+    test("", "")
+    test("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "0110001101011100111110000100011001010011101001010110110101111100011001110101101111100111011111011111000000010010001101000101")
\ No newline at end of file
@@ -1,4 +1,14 @@
 import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from array import array
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import timezone, datetime
 
 class Block:
@@ -78,62 +88,853 @@ class BlockChain:
         return True
 
 
-"""
-Test case 1: A chain with zero blocks is valid
-"""
-no_blocks = BlockChain()
-no_blocks.add_data("Andrew")
-assert no_blocks.is_valid()
-
-"""
-Test case 2: A chain with one element is valid when there is no tampering
-"""
-one_block_tamper = BlockChain()
-one_block_tamper.add_data("Andrew")
-assert one_block_tamper.is_valid()
-
-"""
-Test case 3: A chain with several elements is valid when there is no tampering
-"""
-several_blocks_no_tamper = BlockChain()
-several_blocks_no_tamper.add_data("Nessin")
-several_blocks_no_tamper.add_data("Data Structures")
-several_blocks_no_tamper.add_data("Udacity")
-several_blocks_no_tamper.add_data("Algorithms")
-several_blocks_no_tamper.add_data("Simple Blockchain")
-assert several_blocks_no_tamper.is_valid()
-
-"""
-Test case 4: A chain with one element is invalid when data is tampered after creation
-"""
-one_block_tamper = BlockChain()
-one_block_tamper.add_data("Andrew")
-one_block_tamper.head.data = "Tampered Andrew"
-assert one_block_tamper.is_valid() == False
-
-"""
-Test case 5: A chain with several elements is invalid when data of any block is tampered after creation
-"""
-several_blocks_no_tamper = BlockChain()
-several_blocks_no_tamper.add_data("Nessin")
-several_blocks_no_tamper.add_data("Data Structures")
-several_blocks_no_tamper.add_data("Udacity")
-
-random_block = several_blocks_no_tamper.head.next
-random_block.data = "tampered Data Structures"
-
-assert several_blocks_no_tamper.is_valid() == False
-
-"""
-Test case 5: A chain with several elements is invalid when data is tampered after creation, and hashcode for that block is recalculated. The current is_valid() implementation does not work if tail of the blockchain is tampered this way. Such tampering can be detected and corrected in a distributed environment where each node communicates with each other to reach a consensus on the valid blocks.
-"""
-several_blocks_tamper = BlockChain()
-several_blocks_tamper.add_data("Nessin")
-several_blocks_tamper.add_data("Data Structures")
-several_blocks_tamper.add_data("Udacity")
-
-random_block = several_blocks_tamper.head.next
-random_block.data = "tampered Data Structures"
-random_block.hash = random_block._calculate_hash()
-
-assert several_blocks_tamper.is_valid() == False
\ No newline at end of file
+# Previous hash of the first block in an ArrayBlockChain. Using 32 zero bytes instead of None keeps every block's hash input the same shape.
+GENESIS_PREV_HASH = bytes(32)
+
+# Timestamps of compact blocks are packed as signed 64 bit big-endian integers (microseconds since epoch) before hashing.
+_TIMESTAMP = struct.Struct(">q")
+
+def _now_micros():
+    return time.time_ns() // 1000
+
+def _hash_fields(timestamp, prev_hash, data):
+    return hashlib.sha256(_TIMESTAMP.pack(timestamp) + prev_hash + data.encode("utf-8")).digest()
+
+class CompactBlock:
+    """
+    Same idea as Block, but built for chains with millions of blocks. It has no prev/next pointers, declares __slots__ so there is no per-instance __dict__, keeps the timestamp as integer microseconds since epoch and stores hashes as raw 32 byte sha256 digests instead of 64 character hex strings.
+    """
+    __slots__ = ("data", "timestamp", "prev_hash", "hash")
+
+    def __init__(self, data, prev_hash=GENESIS_PREV_HASH, timestamp=None, block_hash=None):
+        self.data = data
+        self.timestamp = _now_micros() if timestamp is None else timestamp
+        self.prev_hash = prev_hash
+        self.hash = self._calculate_hash() if block_hash is None else block_hash
+
+    def _calculate_hash(self):
+        return _hash_fields(self.timestamp, self.prev_hash, self.data)
+
+    def __repr__(self):
+        return "\n".join(
+            ["Data: " + self.data,
+            "Created time: " + str(datetime.fromtimestamp(self.timestamp / 1_000_000, timezone.utc)),
+            "Hash:" + self.hash.hex(),
+            "Previous hash: " + self.prev_hash.hex(),
+            "---------",
+            ""])
+
+
+# Leaves and internal nodes of a MerkleTree are hashed with different prefixes (as in RFC 6962), so an internal node can never be passed off as a leaf.
+def _hash_leaf(block_hash):
+    return hashlib.sha256(b"\x00" + block_hash).digest()
+
+def _hash_pair(left, right):
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+class MerkleTree:
+    """
+    Merkle tree over block hashes. levels[0] holds the leaves (the hashes of the block hashes, in chain order) and each level above holds the hashes of pairs of nodes below it. A node without a right sibling is copied to the level above as it is. The only node of the last level is the root.
+
+    Appending a leaf recomputes only the nodes on the path from that leaf to the root, so it is O(log n).
+    See section "Merkle Tree" in explanation for details.
+    """
+    def __init__(self, block_hashes=()):
+        self.levels = [[]]
+        self.extend(block_hashes)
+
+    def __len__(self):
+        return len(self.levels[0])
+
+    def root(self):
+        if not self.levels[0]:
+            return None
+        return self.levels[-1][0]
+
+    def append(self, block_hash):
+        self.levels[0].append(_hash_leaf(block_hash))
+        index = len(self.levels[0]) - 1
+        level = 0
+        while len(self.levels[level]) > 1:
+            nodes = self.levels[level]
+            left = index - index % 2
+            parent = _hash_pair(nodes[left], nodes[left + 1]) if left + 1 < len(nodes) else nodes[left]
+
+            if level + 1 == len(self.levels):
+                self.levels.append([])
+            parents = self.levels[level + 1]
+            index //= 2
+            if index == len(parents):
+                parents.append(parent)
+            else:
+                parents[index] = parent
+            level += 1
+
+    def extend(self, block_hashes):
+        """
+        Appends leaves for the block hashes and recomputes the nodes above them one level at a time. For k new leaves, this is O(k + log n) instead of O(k log n) for k appends.
+        """
+        first_changed = len(self.levels[0])
+        self.levels[0].extend(map(_hash_leaf, block_hashes))
+        if first_changed == len(self.levels[0]):
+            return
+
+        level = 0
+        while len(self.levels[level]) > 1:
+            nodes = self.levels[level]
+            if level + 1 == len(self.levels):
+                self.levels.append([])
+            parents = self.levels[level + 1]
+
+            first_changed //= 2
+            del parents[first_changed:]
+            for left in range(first_changed * 2, len(nodes), 2):
+                parents.append(_hash_pair(nodes[left], nodes[left + 1]) if left + 1 < len(nodes) else nodes[left])
+            level += 1
+
+    def proof(self, index):
+        """
+        Returns the inclusion proof of the block at index. It is the list of sibling hashes from the leaf level up to the root. verify_merkle_proof() checks it.
+        """
+        proof = []
+        for nodes in self.levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(nodes):
+                proof.append(nodes[sibling])
+            index //= 2
+        return proof
+
+    def find_divergence(self, other):
+        """
+        Returns the index of the first leaf that differs between this tree and other, or -1 if they have the same leaves. If the leaves of the shorter tree are a prefix of the longer one, the first differing leaf is the first one the shorter tree does not have, so the shorter tree's length is returned.
+        The common prefix is split into full subtrees of 2^k leaves, from the largest to the smallest. A full subtree has the same hash in both trees if their leaves match, whatever the lengths of the trees. The first one that differs is descended into the left child if the left children differ, or the right child otherwise. So only O(log n) nodes are compared.
+        """
+        if len(self) == len(other) and self.root() == other.root():
+            return -1
+
+        common = min(len(self), len(other))
+        offset = 0
+        for level in range(common.bit_length() - 1, -1, -1):
+            if not common & (1 << level):
+                continue
+            index = offset >> level
+            if self.levels[level][index] != other.levels[level][index]:
+                for child_level in range(level - 1, -1, -1):
+                    left = index * 2
+                    index = left if self.levels[child_level][left] != other.levels[child_level][left] else left + 1
+                return index
+            offset += 1 << level
+        return common
+
+def verify_merkle_proof(block_hash, index, leaf_count, proof, root):
+    """
+    Returns True if proof shows that block_hash is the block at index of a tree with leaf_count blocks and the given root.
+    The index and leaf count decide on which side each sibling is, and which levels have no sibling, so the proof cannot be replayed for another position.
+    """
+    if not 0 <= index < leaf_count:
+        return False
+
+    node_hash = _hash_leaf(block_hash)
+    used = 0
+    width = leaf_count
+    while width > 1:
+        if index % 2 == 1 or index + 1 < width: # A node without a right sibling is copied up as it is
+            if used == len(proof):
+                return False
+            sibling_hash = proof[used]
+            used += 1
+            node_hash = _hash_pair(sibling_hash, node_hash) if index % 2 == 1 else _hash_pair(node_hash, sibling_hash)
+        index //= 2
+        width = (width + 1) // 2
+
+    return used == len(proof) and node_hash == root
+
+class ArrayBlockChain:
+    """
+    This class stores the blocks in a python list, in insertion order. The position of a block in the list is its height, so retrieving a block by height is O(1). A dictionary from block hash to height makes retrieving a block by its hash O(1) as well. A MerkleTree over the block hashes lets replicas compare chains and locate a tampered block in O(log n).
+
+    Any other storage that supports len(), iteration, indexing by height, append() and extend() can be passed instead of the list, for example a BlockLog to keep the chain on disk. The hash dictionary and the Merkle tree are filled lazily, so opening a chain from an existing BlockLog does not read every block.
+    """
+    def __init__(self, storage=None):
+        self.blocks = [] if storage is None else storage
+        self.height_by_hash = dict()
+        self.merkle = MerkleTree()
+        self._indexed_height = 0 # Blocks below this height are in height_by_hash and merkle
+
+    def __len__(self):
+        return len(self.blocks)
+
+    def __iter__(self):
+        return iter(self.blocks)
+
+    def add_block(self, block: CompactBlock):
+        """
+        Appends an already built block as it is. This is used to replicate blocks from another chain. add_data() should be used for new data.
+        """
+        self.blocks.append(block)
+        if self._indexed_height == len(self.blocks) - 1:
+            self.height_by_hash[block.hash] = self._indexed_height
+            self.merkle.append(block.hash)
+            self._indexed_height += 1
+
+    def add_data(self, data):
+        if self.blocks:
+            self.add_block(CompactBlock(data, self.blocks[-1].hash))
+        else:
+            self.add_block(CompactBlock(data))
+
+    def add_many(self, iterable, batch_size=10_000, shared_timestamp=True):
+        """
+        Adds a block for each data in iterable and returns the number of blocks added. The iterable is consumed in batches of batch_size, so it can be a generator of any length.
+
+        Each batch is handed to the storage and the Merkle tree with a single extend() call, which is where the speedup over looped add_data() comes from. With shared_timestamp, all blocks of a batch get the same timestamp, which only saves reading the clock per block.
+        See section "Bulk Ingestion" in explanation for details.
+        """
+        prev_hash = self.blocks[-1].hash if self.blocks else GENESIS_PREV_HASH
+        iterator = iter(iterable)
+        added = 0
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                return added
+
+            new_blocks = []
+            timestamp = _now_micros()
+            for data in batch:
+                if not shared_timestamp:
+                    timestamp = _now_micros()
+                block = CompactBlock(data, prev_hash, timestamp, _hash_fields(timestamp, prev_hash, data))
+                new_blocks.append(block)
+                prev_hash = block.hash
+
+            caught_up = self._indexed_height == len(self.blocks)
+            self.blocks.extend(new_blocks)
+            if caught_up:
+                self._index_blocks(new_blocks)
+            added += len(new_blocks)
+
+    def get_by_height(self, height) -> CompactBlock:
+        return self.blocks[height]
+
+    def get_by_hash(self, block_hash) -> CompactBlock:
+        self._index_hashes()
+        height = self.height_by_hash.get(block_hash)
+        if height is None:
+            return None
+        return self.blocks[height]
+
+    def merkle_tree(self) -> MerkleTree:
+        self._index_hashes()
+        return self.merkle
+
+    def _index_hashes(self):
+        # Catch up on blocks that were already in the storage when the chain was created
+        if self._indexed_height < len(self.blocks):
+            self._index_blocks([self.blocks[height] for height in range(self._indexed_height, len(self.blocks))])
+
+    def _index_blocks(self, blocks):
+        hashes = [block.hash for block in blocks]
+        self.height_by_hash.update(zip(hashes, range(self._indexed_height, self._indexed_height + len(hashes))))
+        self.merkle.extend(hashes)
+        self._indexed_height += len(hashes)
+
+    def __repr__(self):
+        return "".join(map(str, self.blocks))
+
+    def is_valid(self):
+        prev_hash = GENESIS_PREV_HASH
+        for block in self.blocks:
+            if block.prev_hash != prev_hash or block.hash != block._calculate_hash():
+                return False
+            prev_hash = block.hash
+
+        return True
+
+
+# Each record in a BlockLog is a 4 byte payload length and a 4 byte CRC32 of the payload, followed by the payload.
+# The payload is the timestamp, previous hash and hash of the block, followed by its utf-8 data.
+_RECORD_PREFIX = struct.Struct(">II")
+_RECORD_HEADER = struct.Struct(">q32s32s")
+
+class BlockLog:
+    """
+    Append-only file of compact blocks. It can be used as the storage of an ArrayBlockChain so the chain survives restarts without re-hashing.
+
+    Records are read through mmap, so only the blocks that are accessed are loaded. A sidecar index file ("<path>.idx") holds the 8 byte offset of every record, so opening the log reads the index only and not the whole chain.
+
+    Appending writes and fsyncs the record before its offset is added to the index. The index is not fsynced, so it is only trusted as far as each offset starts exactly where the previous record ends. From the first offset that does not, the index is rebuilt by scanning the log. A record at the end of the log that is incomplete, or whose payload does not match its CRC32, is torn and truncated on recovery.
+    See section "Persistent Blockchain" in explanation for details.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.index_path = path + ".idx"
+        self.log_file = open(path, "a+b")
+        self.index_file = open(self.index_path, "a+b")
+        self.offsets = array("Q")
+        self._map = None
+        self._recover()
+
+    def _recover(self):
+        self.index_file.seek(0)
+        index_bytes = self.index_file.read()
+        index_bytes = index_bytes[:len(index_bytes) - len(index_bytes) % self.offsets.itemsize]
+        self.offsets.frombytes(index_bytes)
+        if sys.byteorder == "big": # The index is always written little endian
+            self.offsets.byteswap()
+
+        log_size = os.fstat(self.log_file.fileno()).st_size
+        log_map = mmap.mmap(self.log_file.fileno(), 0, access=mmap.ACCESS_READ) if log_size else b""
+
+        # Keep the indexed offsets while each one starts where the previous record ends. Only the record lengths are read here, so this stays fast for large logs.
+        position = 0
+        indexed_count = 0
+        for offset in self.offsets:
+            record_end = self._record_end(log_map, offset, log_size) if offset == position else None
+            if record_end is None:
+                break
+            position = record_end
+            indexed_count += 1
+
+        # The last kept record may have been torn by a crash before its payload reached the disk, so its CRC32 is checked as well.
+        if indexed_count and self._record_end(log_map, self.offsets[indexed_count - 1], log_size, check_crc=True) is None:
+            indexed_count -= 1
+            position = self.offsets[indexed_count]
+        del self.offsets[indexed_count:]
+
+        # Recover records that made it to the log but not to the index
+        record_end = self._record_end(log_map, position, log_size, check_crc=True)
+        while record_end is not None:
+            self.offsets.append(position)
+            position = record_end
+            record_end = self._record_end(log_map, position, log_size, check_crc=True)
+
+        if log_size:
+            log_map.close()
+        if position < log_size:
+            self.log_file.truncate(position)
+            self._sync(self.log_file)
+
+        self._rewrite_index(indexed_count)
+
+    def _record_end(self, log_map, position, log_size, check_crc=False):
+        """
+        Returns the offset right after the record at position, or None if there is no complete record there.
+        """
+        if position + _RECORD_PREFIX.size > log_size:
+            return None
+        length, crc = _RECORD_PREFIX.unpack_from(log_map, position)
+        payload_start = position + _RECORD_PREFIX.size
+        record_end = payload_start + length
+        if length < _RECORD_HEADER.size or record_end > log_size:
+            return None
+        if check_crc and zlib.crc32(log_map[payload_start:record_end]) != crc:
+            return None
+        return record_end
+
+    def _rewrite_index(self, indexed_count):
+        # Offsets that were kept are left as they are. The rest of the index is replaced by the recovered offsets.
+        self.index_file.truncate(indexed_count * self.offsets.itemsize)
+        if indexed_count < len(self.offsets):
+            self._write_offsets(self.offsets[indexed_count:])
+        self._sync(self.index_file)
+
+    def _write_offsets(self, offsets):
+        if sys.byteorder == "big":
+            offsets = array("Q", offsets)
+            offsets.byteswap()
+        self.index_file.write(offsets.tobytes())
+
+    def _sync(self, file):
+        file.flush()
+        os.fsync(file.fileno())
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __iter__(self):
+        for height in range(len(self.offsets)):
+            yield self[height]
+
+    def __getitem__(self, height) -> CompactBlock:
+        offset = self.offsets[height]
+        start = offset + _RECORD_PREFIX.size
+        if self._map is None or offset >= len(self._map):
+            self._remap()
+
+        length, _ = _RECORD_PREFIX.unpack_from(self._map, offset)
+        timestamp, prev_hash, block_hash = _RECORD_HEADER.unpack_from(self._map, start)
+        data = self._map[start + _RECORD_HEADER.size:start + length].decode("utf-8")
+        return CompactBlock(data, prev_hash, timestamp, block_hash)
+
+    def _remap(self):
+        # The mapping has a fixed size, so it is recreated once blocks are appended after it was created
+        if self._map is not None:
+            self._map.close()
+        self.log_file.flush()
+        self._map = mmap.mmap(self.log_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def append(self, block: CompactBlock):
+        payload = _RECORD_HEADER.pack(block.timestamp, block.prev_hash, block.hash) + block.data.encode("utf-8")
+        offset = self.log_file.seek(0, os.SEEK_END)
+        self.log_file.write(_RECORD_PREFIX.pack(len(payload), zlib.crc32(payload)) + payload)
+        self._sync(self.log_file)
+
+        self.offsets.append(offset)
+        self._write_offsets(self.offsets[-1:])
+        self.index_file.flush()
+
+    def extend(self, blocks):
+        """
+        Same as append() for each block, but all the records are written with a single write and fsync.
+        """
+        offset = self.log_file.seek(0, os.SEEK_END)
+        records = []
+        new_offsets = array("Q")
+        for block in blocks:
+            payload = _RECORD_HEADER.pack(block.timestamp, block.prev_hash, block.hash) + block.data.encode("utf-8")
+            records.append(_RECORD_PREFIX.pack(len(payload), zlib.crc32(payload)))
+            records.append(payload)
+            new_offsets.append(offset)
+            offset += _RECORD_PREFIX.size + len(payload)
+        self.log_file.write(b"".join(records))
+        self._sync(self.log_file)
+
+        self.offsets.extend(new_offsets)
+        self._write_offsets(new_offsets)
+        self.index_file.flush()
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self.index_file.close()
+        self.log_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _first_invalid_hash(start_height, fields):
+    """
+    Re-hashes a chunk of blocks given as (timestamp, prev_hash, data, hash) tuples. Returns the height of the first block whose hash does not match, or -1 if all of them match.
+    This is a module level function so that it can be sent to worker processes.
+    """
+    for offset, (timestamp, prev_hash, data, block_hash) in enumerate(fields):
+        if _hash_fields(timestamp, prev_hash, data) != block_hash:
+            return start_height + offset
+    return -1
+
+class ChainValidator:
+    """
+    Validates an ArrayBlockChain by splitting the re-hashing of blocks across workers. Checking that each block's prev_hash matches the hash of the block before it is cheap, so it is done in the calling process. Re-hashing a block depends only on its own fields, so the blocks are re-hashed in chunks, in parallel.
+
+    workers=1 re-hashes in the calling process. Otherwise, a process pool is used, or a thread pool if use_threads is True. Threads only help for large blocks because hashlib releases the GIL only for data of about 2KB or more.
+
+    The validator remembers the height and hash of the last block it validated (the checkpoint). is_valid(chain, incremental=True) validates only the blocks appended after the checkpoint. Tampering of blocks below the checkpoint is not detected in this mode. If the chain is shorter than the checkpoint, or its block at the checkpoint has a different hash, the whole chain is validated instead.
+    See section "Parallel and Incremental Validation" in explanation for details.
+    """
+    def __init__(self, workers=1, use_threads=False, chunk_size=10_000):
+        self.workers = workers
+        self.use_threads = use_threads
+        self.chunk_size = chunk_size
+        self.validated_height = 0
+        self.last_hash = GENESIS_PREV_HASH
+
+    def is_valid(self, chain: ArrayBlockChain, incremental=False):
+        if incremental and not self._checkpoint_matches(chain):
+            incremental = False # The chain is shorter than, or does not contain, the last validated block, so it is validated in full
+        start_height = self.validated_height if incremental else 0
+        prev_hash = self.last_hash if incremental else GENESIS_PREV_HASH
+
+        fields = []
+        for height in range(start_height, len(chain)):
+            block = chain.get_by_height(height)
+            if block.prev_hash != prev_hash:
+                return False
+            fields.append((block.timestamp, block.prev_hash, block.data, block.hash))
+            prev_hash = block.hash
+
+        if self._first_invalid_height(start_height, fields) != -1:
+            return False
+
+        self.validated_height = len(chain)
+        self.last_hash = prev_hash
+        return True
+
+    def _checkpoint_matches(self, chain):
+        if self.validated_height == 0:
+            return True
+        if len(chain) < self.validated_height:
+            return False
+        return chain.get_by_height(self.validated_height - 1).hash == self.last_hash
+
+    def _first_invalid_height(self, start_height, fields):
+        chunk_starts = range(0, len(fields), self.chunk_size)
+        heights = [start_height + chunk_start for chunk_start in chunk_starts]
+        chunks = [fields[chunk_start:chunk_start + self.chunk_size] for chunk_start in chunk_starts]
+
+        if self.workers == 1 or len(chunks) <= 1:
+            results = map(_first_invalid_hash, heights, chunks)
+            return next((height for height in results if height != -1), -1)
+
+        executor_class = ThreadPoolExecutor if self.use_threads else ProcessPoolExecutor
+        with executor_class(max_workers=self.workers) as executor:
+            results = executor.map(_first_invalid_hash, heights, chunks)
+            return next((height for height in results if height != -1), -1)
+
+def benchmark_validation(block_count=200_000, data_size=64, workers=None):
+    """
+    Prints and returns the blocks/sec of each validation mode on a chain of block_count blocks.
+    The incremental mode validates the last 1% of the chain after the rest was validated, and its rate counts only those blocks.
+    """
+    workers = workers or os.cpu_count()
+    chain = ArrayBlockChain()
+    for index in range(block_count):
+        chain.add_data(str(index).rjust(data_size, "x"))
+
+    modes = {
+        "serial": ChainValidator(),
+        "threads": ChainValidator(workers=workers, use_threads=True),
+        "processes": ChainValidator(workers=workers),
+    }
+    results = dict()
+    for mode, validator in modes.items():
+        start = time.perf_counter()
+        assert validator.is_valid(chain)
+        results[mode] = block_count / (time.perf_counter() - start)
+
+    new_blocks = max(1, block_count // 100)
+    validator = ChainValidator()
+    validator.validated_height = block_count - new_blocks
+    validator.last_hash = chain.get_by_height(validator.validated_height - 1).hash if validator.validated_height else GENESIS_PREV_HASH
+    start = time.perf_counter()
+    assert validator.is_valid(chain, incremental=True)
+    results["incremental"] = new_blocks / (time.perf_counter() - start)
+
+    for mode, blocks_per_sec in results.items():
+        print(f"{mode}: {blocks_per_sec:,.0f} blocks/sec")
+    return results
+
+# Uncomment below function call to benchmark the validation modes.
+# benchmark_validation()
+
+def benchmark_ingest(block_count=200_000, data_size=64):
+    """
+    Prints and returns the blocks/sec of adding block_count blocks with looped add_data() and with add_many().
+    """
+    def generate_data():
+        for index in range(block_count):
+            yield str(index).rjust(data_size, "x")
+
+    results = dict()
+    start = time.perf_counter()
+    chain = ArrayBlockChain()
+    for data in generate_data():
+        chain.add_data(data)
+    results["add_data"] = block_count / (time.perf_counter() - start)
+
+    for mode, shared_timestamp in [("add_many", True), ("add_many per-block timestamp", False)]:
+        start = time.perf_counter()
+        ArrayBlockChain().add_many(generate_data(), shared_timestamp=shared_timestamp)
+        results[mode] = block_count / (time.perf_counter() - start)
+
+    for mode, blocks_per_sec in results.items():
+        print(f"{mode}: {blocks_per_sec:,.0f} blocks/sec")
+    return results
+
+# Uncomment below function call to benchmark bulk ingestion.
+# benchmark_ingest()
+
+if __name__ == "__main__":
+    """
+    Test case 1: A chain with zero blocks is valid
+    """
+    no_blocks = BlockChain()
+    no_blocks.add_data("Andrew")
+    assert no_blocks.is_valid()
+
+    """
+    Test case 2: A chain with one element is valid when there is no tampering
+    """
+    one_block_tamper = BlockChain()
+    one_block_tamper.add_data("Andrew")
+    assert one_block_tamper.is_valid()
+
+    """
+    Test case 3: A chain with several elements is valid when there is no tampering
+    """
+    several_blocks_no_tamper = BlockChain()
+    several_blocks_no_tamper.add_data("Nessin")
+    several_blocks_no_tamper.add_data("Data Structures")
+    several_blocks_no_tamper.add_data("Udacity")
+    several_blocks_no_tamper.add_data("Algorithms")
+    several_blocks_no_tamper.add_data("Simple Blockchain")
+    assert several_blocks_no_tamper.is_valid()
+
+    """
+    Test case 4: A chain with one element is invalid when data is tampered after creation
+    """
+    one_block_tamper = BlockChain()
+    one_block_tamper.add_data("Andrew")
+    one_block_tamper.head.data = "Tampered Andrew"
+    assert one_block_tamper.is_valid() == False
+
+    """
+    Test case 5: A chain with several elements is invalid when data of any block is tampered after creation
+    """
+    several_blocks_no_tamper = BlockChain()
+    several_blocks_no_tamper.add_data("Nessin")
+    several_blocks_no_tamper.add_data("Data Structures")
+    several_blocks_no_tamper.add_data("Udacity")
+
+    random_block = several_blocks_no_tamper.head.next
+    random_block.data = "tampered Data Structures"
+
+    assert several_blocks_no_tamper.is_valid() == False
+
+    """
+    Test case 5: A chain with several elements is invalid when data is tampered after creation, and hashcode for that block is recalculated. The current is_valid() implementation does not work if tail of the blockchain is tampered this way. Such tampering can be detected and corrected in a distributed environment where each node communicates with each other to reach a consensus on the valid blocks.
+    """
+    several_blocks_tamper = BlockChain()
+    several_blocks_tamper.add_data("Nessin")
+    several_blocks_tamper.add_data("Data Structures")
+    several_blocks_tamper.add_data("Udacity")
+
+    random_block = several_blocks_tamper.head.next
+    random_block.data = "tampered Data Structures"
+    random_block.hash = random_block._calculate_hash()
+
+    assert several_blocks_tamper.is_valid() == False
+
+    """
+    Test case 7: An array backed chain is valid when there is no tampering, and blocks can be retrieved by height and by hash
+    """
+    array_chain = ArrayBlockChain()
+    array_chain.add_data("Nessin")
+    array_chain.add_data("Data Structures")
+    array_chain.add_data("Udacity")
+    assert array_chain.is_valid()
+    assert len(array_chain) == 3
+    assert array_chain.get_by_height(0).data == "Nessin"
+    assert array_chain.get_by_height(0).prev_hash == GENESIS_PREV_HASH
+    assert array_chain.get_by_height(2).prev_hash == array_chain.get_by_height(1).hash
+    assert len(array_chain.get_by_height(1).hash) == 32
+    assert array_chain.get_by_hash(array_chain.get_by_height(1).hash).data == "Data Structures"
+    assert array_chain.get_by_hash(bytes(32)) is None
+
+    """
+    Test case 8: An array backed chain is invalid when data of any block is tampered after creation
+    """
+    array_chain.get_by_height(1).data = "tampered Data Structures"
+    assert array_chain.is_valid() == False
+
+    """
+    Test case 9: An array backed chain is invalid when a block is tampered and its hash is recalculated, except when it is the last block
+    """
+    array_chain.get_by_height(1).hash = array_chain.get_by_height(1)._calculate_hash()
+    assert array_chain.is_valid() == False
+
+    array_tail_tamper = ArrayBlockChain()
+    array_tail_tamper.add_data("Nessin")
+    array_tail_tamper.add_data("Udacity")
+    array_tail_tamper.get_by_height(-1).data = "tampered Udacity"
+    array_tail_tamper.get_by_height(-1).hash = array_tail_tamper.get_by_height(-1)._calculate_hash()
+    assert array_tail_tamper.is_valid()
+
+    """
+    Test case 10: A chain stored in a BlockLog can be reopened without re-hashing, and blocks can be retrieved by height and by hash
+    """
+    with tempfile.TemporaryDirectory() as log_dir:
+        log_path = os.path.join(log_dir, "chain.log")
+        with BlockLog(log_path) as block_log:
+            log_chain = ArrayBlockChain(block_log)
+            log_chain.add_data("Nessin")
+            log_chain.add_data("Data Structures")
+            log_chain.get_by_height(0) # Maps the log before the next append, so it has to be remapped
+            log_chain.add_data("Udacity")
+            saved_hashes = [block.hash for block in log_chain]
+
+        with BlockLog(log_path) as block_log:
+            log_chain = ArrayBlockChain(block_log)
+            assert len(log_chain) == 3
+            assert [block.hash for block in log_chain] == saved_hashes
+            assert log_chain.get_by_height(1).data == "Data Structures"
+            assert log_chain.get_by_hash(saved_hashes[2]).data == "Udacity"
+            assert log_chain.is_valid()
+
+            log_chain.add_data("Algorithms")
+            assert log_chain.get_by_hash(log_chain.get_by_height(-1).hash).data == "Algorithms"
+            assert log_chain.is_valid()
+
+        """
+        Test case 11: A torn record at the end of the log is truncated, and records missing from the index are recovered on reopen
+        """
+        log_size = os.path.getsize(log_path)
+        with open(log_path, "ab") as log_file:
+            log_file.write(_RECORD_PREFIX.pack(100, 0) + b"torn")
+        with open(log_path + ".idx", "r+b") as index_file:
+            index_file.truncate(2 * 8 + 3)
+
+        with BlockLog(log_path) as block_log:
+            log_chain = ArrayBlockChain(block_log)
+            assert os.path.getsize(log_path) == log_size
+            assert os.path.getsize(log_path + ".idx") == 4 * 8
+            assert len(log_chain) == 4
+            assert log_chain.get_by_height(-1).data == "Algorithms"
+            assert log_chain.is_valid()
+
+            log_chain.add_many((f"Bulk {index}" for index in range(5)), batch_size=2)
+            assert len(log_chain) == 9
+            assert log_chain.is_valid()
+
+        with BlockLog(log_path) as block_log:
+            assert [block.data for block in block_log][-5:] == [f"Bulk {index}" for index in range(5)]
+
+        """
+        Test case 12: Index entries that do not start where the previous record ends are dropped and rebuilt from the log, and a last record with a bad CRC32 is treated as torn
+        """
+        with open(log_path + ".idx", "ab") as index_file:
+            index_file.write(bytes(16)) # Zero filled tail, as left by a crash before the index was written
+        with BlockLog(log_path) as block_log:
+            assert len(block_log) == 9
+            assert ArrayBlockChain(block_log).is_valid()
+
+        with open(log_path + ".idx", "r+b") as index_file:
+            index_file.seek(8)
+            index_file.write(bytes(8))
+        with BlockLog(log_path) as block_log:
+            assert [block.data for block in block_log] == ["Nessin", "Data Structures", "Udacity", "Algorithms"] + [f"Bulk {index}" for index in range(5)]
+
+        log_size = os.path.getsize(log_path)
+        with open(log_path, "ab") as log_file:
+            log_file.write(_RECORD_PREFIX.pack(_RECORD_HEADER.size, 0) + bytes(_RECORD_HEADER.size))
+        with BlockLog(log_path) as block_log:
+            assert len(block_log) == 9
+            assert os.path.getsize(log_path) == log_size
+
+    """
+    Test case 13: ChainValidator agrees with is_valid() with and without workers, and the incremental mode validates only the blocks appended after the checkpoint
+    """
+    validated_chain = ArrayBlockChain()
+    for index in range(25):
+        validated_chain.add_data(f"Block {index}")
+
+    serial_validator = ChainValidator(chunk_size=10)
+    thread_validator = ChainValidator(workers=2, use_threads=True, chunk_size=10)
+    assert serial_validator.is_valid(validated_chain)
+    assert thread_validator.is_valid(validated_chain)
+    assert serial_validator.validated_height == 25
+
+    validated_chain.add_data("Block 25")
+    validated_chain.get_by_height(12).data = "tampered Block 12"
+    assert serial_validator.is_valid(validated_chain, incremental=True) # Block 12 is below the checkpoint
+    assert serial_validator.validated_height == 26
+    assert serial_validator.is_valid(validated_chain) == False
+    assert thread_validator.is_valid(validated_chain) == False
+
+    validated_chain.get_by_height(12).data = "Block 12"
+    validated_chain.add_data("Block 26")
+    validated_chain.get_by_height(-1).data = "tampered Block 26"
+    assert serial_validator.is_valid(validated_chain, incremental=True) == False
+    assert serial_validator.validated_height == 26
+
+    # A shorter chain, or a chain whose block at the checkpoint has a different hash, does not match the checkpoint and is validated in full
+    short_chain = ArrayBlockChain()
+    short_chain.add_data("Block 0")
+    assert serial_validator.is_valid(short_chain, incremental=True)
+    assert serial_validator.validated_height == 1
+    short_chain.get_by_height(0).data = "tampered Block 0"
+    short_chain.get_by_height(0).hash = short_chain.get_by_height(0)._calculate_hash()
+    short_chain.add_data("Block 1")
+    assert serial_validator.is_valid(short_chain, incremental=True)
+    assert serial_validator.validated_height == 2
+    short_chain.get_by_height(0).data = "Block 0"
+    short_chain.get_by_height(1).data = "tampered Block 1"
+    short_chain.get_by_height(1).hash = short_chain.get_by_height(1)._calculate_hash()
+    assert serial_validator.is_valid(short_chain, incremental=True) == False # Block 0 is checked again because block 1 no longer has the checkpoint hash
+
+    process_validator = ChainValidator(workers=2, chunk_size=10)
+    assert process_validator.is_valid(validated_chain) == False
+    validated_chain.get_by_height(-1).data = "Block 26"
+    assert process_validator.is_valid(validated_chain)
+
+    """
+    Test case 14: Merkle root changes with every block, and each block has an inclusion proof that verifies against the root
+    """
+    merkle_chain = ArrayBlockChain()
+    merkle_roots = set()
+    for index in range(7):
+        merkle_chain.add_data(f"Block {index}")
+        merkle_roots.add(merkle_chain.merkle_tree().root())
+    assert len(merkle_roots) == 7
+    assert MerkleTree(block.hash for block in merkle_chain).root() == merkle_chain.merkle_tree().root()
+
+    merkle_root = merkle_chain.merkle_tree().root()
+    for height, block in enumerate(merkle_chain):
+        assert verify_merkle_proof(block.hash, height, 7, merkle_chain.merkle_tree().proof(height), merkle_root)
+    assert verify_merkle_proof(merkle_chain.get_by_height(0).hash, 0, 7, merkle_chain.merkle_tree().proof(1), merkle_root) == False
+    assert verify_merkle_proof(merkle_chain.get_by_height(0).hash, 1, 7, merkle_chain.merkle_tree().proof(0), merkle_root) == False
+    assert verify_merkle_proof(merkle_chain.get_by_height(6).hash, 6, 8, merkle_chain.merkle_tree().proof(6), merkle_root) == False
+
+    """
+    Test case 15: A forged proof that passes an internal node off as a block is rejected, and a tree over internal node hashes does not have the same root
+    """
+    a, b, c = (hashlib.sha256(data).digest() for data in [b"a", b"b", b"c"])
+    small_tree = MerkleTree([a, b, c])
+    internal_node, leaf_c = small_tree.levels[1][0], small_tree.levels[0][2]
+    assert verify_merkle_proof(c, 2, 3, small_tree.proof(2), small_tree.root())
+    assert verify_merkle_proof(internal_node, 0, 2, [leaf_c], small_tree.root()) == False
+    assert verify_merkle_proof(internal_node, 0, 3, [leaf_c], small_tree.root()) == False
+    assert MerkleTree([_hash_pair(a, b), c]).root() != small_tree.root()
+
+    """
+    Test case 16: Two replicas with the same blocks have the same Merkle root. When the last block of one replica is tampered and its hash is recalculated, is_valid() cannot detect it, but comparing Merkle roots does, and the tampered block is found by descending the trees
+    """
+    replica = ArrayBlockChain()
+    for block in merkle_chain:
+        replica.add_block(CompactBlock(block.data, block.prev_hash, block.timestamp, block.hash))
+    assert replica.merkle_tree().root() == merkle_root
+    assert replica.merkle_tree().find_divergence(merkle_chain.merkle_tree()) == -1
+
+    tampered_tail = replica.get_by_height(-1)
+    tampered_tail.data = "tampered Block 6"
+    tampered_tail.hash = tampered_tail._calculate_hash()
+    assert replica.is_valid()
+
+    replica_tree = MerkleTree(block.hash for block in replica)
+    assert replica_tree.root() != merkle_root
+    assert replica_tree.find_divergence(merkle_chain.merkle_tree()) == 6
+
+    replica.get_by_height(2).data = "tampered Block 2"
+    replica.get_by_height(2).hash = replica.get_by_height(2)._calculate_hash()
+    assert MerkleTree(block.hash for block in replica).find_divergence(merkle_chain.merkle_tree()) == 2
+
+    # Trees of different lengths are compared on their common prefix. If it matches, the first block only the longer tree has is the divergence.
+    prefix_tree = MerkleTree(merkle_chain.get_by_height(height).hash for height in range(5))
+    assert prefix_tree.find_divergence(merkle_chain.merkle_tree()) == merkle_chain.merkle_tree().find_divergence(prefix_tree) == 5
+    assert replica_tree.find_divergence(prefix_tree) == 5
+    assert MerkleTree(block.hash for block in replica).find_divergence(prefix_tree) == 2
+    assert MerkleTree().find_divergence(prefix_tree) == 0
+    assert MerkleTree().find_divergence(MerkleTree()) == -1
+
+    """
+    Test case 17: add_many() streams data from a generator in batches and builds the same chain structure as looped add_data()
+    """
+    bulk_chain = ArrayBlockChain()
+    bulk_chain.add_data("Nessin")
+    assert bulk_chain.add_many((f"Block {index}" for index in range(25)), batch_size=10) == 25
+    assert len(bulk_chain) == 26
+    assert [block.data for block in bulk_chain][1:] == [f"Block {index}" for index in range(25)]
+    assert bulk_chain.is_valid()
+    assert ChainValidator(chunk_size=10).is_valid(bulk_chain)
+    assert bulk_chain.get_by_hash(bulk_chain.get_by_height(20).hash).data == "Block 19"
+    assert bulk_chain.merkle_tree().root() == MerkleTree(block.hash for block in bulk_chain).root()
+    assert bulk_chain.get_by_height(1).timestamp == bulk_chain.get_by_height(10).timestamp # Same batch
+
+    assert bulk_chain.add_many(["Per", "block", "timestamp"], shared_timestamp=False) == 3
+    assert bulk_chain.add_many([]) == 0
+    assert len(bulk_chain) == 29
+    assert bulk_chain.is_valid()
\ No newline at end of file
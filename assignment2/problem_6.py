@@ -1,4 +1,16 @@
+import math
+import time
+import tracemalloc
+from itertools import chain
+
+try:
+    import numpy as np
+except ImportError: # numpy is optional. It is only used when a numpy array is passed to extend() or from_iterable().
+    np = None
+
 class Node:
+    __slots__ = ("value", "next")
+
     def __init__(self, value):
         self.value = value
         self.next = None
@@ -15,15 +27,11 @@ class LinkedListSet:
         return " -> ".join(map(str,self))
 
     def __iter__(self):
-        self.iter_cur_node = self.head
-        return self
-
-    def __next__(self):
-        if self.iter_cur_node is None:
-            raise StopIteration
-        next_value = self.iter_cur_node.value
-        self.iter_cur_node = self.iter_cur_node.next
-        return next_value
+        # Each call returns a new generator with its own cursor, so nested or concurrent loops over the same list do not affect each other.
+        cur_node = self.head
+        while cur_node:
+            yield cur_node.value
+            cur_node = cur_node.next
 
     def __contains__(self, item):
         return item in self.unique_elements
@@ -47,79 +55,454 @@ class LinkedListSet:
     def to_list(self):
         return [value for value in self]
 
-def union(llist_1, llist_2):
-    union_list = LinkedListSet()
-
-    for each_list in [llist_1, llist_2]:
-        for value in each_list:
-            union_list.append(value)
+    @classmethod
+    def from_iterable(cls, values):
+        llist = cls()
+        llist.extend(values)
+        return llist
+
+    def extend(self, values):
+        """
+        Same as calling append() for each value, but duplicates are dropped in bulk and the new nodes are linked in one pass. See section "Bulk Construction" in explanation for details.
+        """
+        new_values = _unique_values(values)
+        if self.unique_elements:
+            new_values = [value for value in new_values if value not in self.unique_elements]
+        self.unique_elements.update(new_values)
+        self._link(new_values)
+
+    @classmethod
+    def _from_ordered(cls, values, unique_elements=None):
+        """
+        Builds a list from a list or dictionary of values that are already unique. The values are linked in the given order, the same as calling append() for each of them, but without probing the set for each value.
+        unique_elements can be passed if the caller already has the set of the same values.
+        """
+        llist = cls()
+        llist.unique_elements = set(values) if unique_elements is None else unique_elements
+        llist._link(values)
+        return llist
+
+    def _link(self, new_values):
+        # Values must be unique and not in the list yet. Each new value becomes the head, like append().
+        head = self.head
+        for value in new_values:
+            new_node = Node(value)
+            new_node.next = head
+            head = new_node
+        self.head = head
+
+class CompactLinkedListSet:
+    """
+    Same API as LinkedListSet, but each value is stored only once. unique_elements is a dictionary whose keys are the values, which keeps both the insertion order and O(1) membership, so no chain of nodes is needed.
+    Iteration yields the most recently appended value first, which is the same order as LinkedListSet.
+    See section "Compact Mode" in explanation for details.
+    """
+    def __init__(self):
+        self.unique_elements = dict()
 
-    return union_list
+    def __str__(self):
+        return " -> ".join(map(str,self))
 
-def intersection(llist_1, llist_2):
-    intersection_list = LinkedListSet()
+    def __iter__(self):
+        return reversed(self.unique_elements)
 
-    for value in llist_1:
-        if value in llist_2:
-            intersection_list.append(value)
+    def __contains__(self, item):
+        return item in self.unique_elements
 
-    return intersection_list
-        
-def test(list1, list2, expected_list, operation, debug=False):
-    llist1 = LinkedListSet()
-    llist2 = LinkedListSet()
+    def append(self, value):
+        self.unique_elements.setdefault(value)
 
-    for value in list1:
-        llist1.append(value)
+    @classmethod
+    def from_iterable(cls, values):
+        llist = cls()
+        llist.extend(values)
+        return llist
 
-    for value in list2:
-        llist2.append(value)
+    def extend(self, values):
+        if np is not None and isinstance(values, np.ndarray):
+            values = np.unique(values).tolist()
+        # Updating a dictionary keeps the position of keys that are already in it, just like append() ignores them.
+        self.unique_elements.update(dict.fromkeys(values))
 
-    if operation == "union" :
-        assert sorted(union(llist1, llist2).to_list()) == sorted(expected_list)
-        if debug: print(f"Expected: {expected_list}. Actual: {union(llist1, llist2).to_list()}")
-    elif operation == "intersection":
-        assert sorted(intersection(llist1, llist2).to_list()) == sorted(expected_list)
-        if debug: print(f"Expected: {expected_list}. Actual: {intersection(llist1, llist2).to_list()}")
-    else:
-        raise Exception("Operation not recognized")
+    def size(self):
+        return len(self.unique_elements)
 
-    
-    
-#Test case 1: Union of 2 empty llists is an empty list
-test([],[],[],"union")
+    def to_list(self):
+        return [value for value in self]
 
-#Test case 2: Intersection of 2 empty llists is an empty list
-test([],[],[],"intersection")
+    @classmethod
+    def _from_ordered(cls, values, unique_elements=None):
+        llist = cls()
+        llist.unique_elements = dict.fromkeys(values)
+        return llist
 
-#------------------------------------------------------------------------
+def _unique_values(values):
+    """
+    Returns the unique values in the order they first appear. A numpy array is deduplicated with np.unique() instead, which returns its values sorted, as python numbers.
+    """
+    if np is not None and isinstance(values, np.ndarray):
+        return np.unique(values).tolist()
+    return dict.fromkeys(values)
 
-#Test case 3: Union of two lists with one distinct element each
-test([1],[2],[1,2],"union")
+def union(llist_1, llist_2):
+    return union_all(llist_1, llist_2)
 
-#Test case 4: Intersection of two lists with one distinct element each
-test([1],[2],[],"intersection")
+def intersection(llist_1, llist_2):
+    return intersection_all(llist_1, llist_2)
+
+"""
+The below functions use the internal sets of the lists for membership, and link the result in the order of the operands, the same as appending the values one by one would. The result has the type of the first list, or LinkedListSet if the first operand is a view.
+An operand can also be a lazy view, which is iterated and probed with the `in` operator instead. See section "Set Algebra on Many Lists" in explanation for details.
+"""
+def _size(llist):
+    """
+    Returns the size of a list. A view has no size, so it is treated as infinitely large and is iterated last.
+    """
+    return math.inf if isinstance(llist, SetView) else llist.size()
+
+def _members(llist):
+    """
+    Returns the container to check membership on - the internal set or dict of a list, or the view itself.
+    """
+    return llist if isinstance(llist, SetView) else llist.unique_elements
+
+def _result_class(llist):
+    return LinkedListSet if isinstance(llist, SetView) else type(llist)
+
+def union_all(*llists):
+    result_class = _result_class(llists[0]) if llists else LinkedListSet
+    # dict.fromkeys keeps the first occurrence of each value, so the values of the first list come first, followed by the new values of each later list
+    return result_class._from_ordered(dict.fromkeys(chain.from_iterable(llists)))
+
+def intersection_all(*llists):
+    if not llists:
+        return LinkedListSet()
+
+    # Iterate the smallest list in its own order, probing the others from the smallest to the largest, and stop once nothing is left.
+    smallest_first = sorted(llists, key=_size)
+    common = list(smallest_first[0])
+    for llist in smallest_first[1:]:
+        if not common:
+            break
+        common = list(filter(_members(llist).__contains__, common))
+
+    return _result_class(llists[0])._from_ordered(common)
+
+def difference_all(llist, *other_llists):
+    """
+    Returns the values of llist that are not in any of the other lists.
+    """
+    remaining = set(_members(llist))
+    for other in other_llists:
+        if not remaining:
+            break
+        # Iterate whichever is smaller. difference_update() iterates the other set, so it is only used when that set is the smaller one.
+        members = _members(other)
+        if isinstance(members, set) and _size(other) <= len(remaining):
+            remaining.difference_update(members)
+        else:
+            remaining.difference_update([value for value in remaining if value in members])
+
+    return _result_class(llist)._from_ordered(list(filter(remaining.__contains__, llist)), remaining)
+
+class SetView:
+    """
+    Base class of lazy set operations on two operands. An operand can be a LinkedListSet, a CompactLinkedListSet or another view, anything that supports iteration and the `in` operator.
+    Values are yielded on demand and membership is checked on the operands, so no intermediate list is built.
+    A view can also be passed to union_all, intersection_all and difference_all, which return a new list.
+    """
+    def __init__(self, llist_1, llist_2):
+        self.llist_1 = llist_1
+        self.llist_2 = llist_2
 
-#------------------------------------------------------------------------
+    def __str__(self):
+        return " -> ".join(map(str,self))
 
-#Test case 5: Union of two lists with several distinct elements each
-test([1,2,3,4],[5,6,7],[1,2,3,4,5,6,7],"union")
+    def to_list(self):
+        return [value for value in self]
 
-#Test case 6: Intersection of two lists with several distinct elements each
-test([1,2,3,4],[5,6,7],[],"intersection")
+class UnionView(SetView):
+    def __iter__(self):
+        yield from self.llist_1
+        for value in self.llist_2:
+            if value not in self.llist_1:
+                yield value
 
-#------------------------------------------------------------------------
+    def __contains__(self, item):
+        return item in self.llist_1 or item in self.llist_2
 
-#Test case 7: Union of two lists with overlapping elements without duplicate elements in a list
-test([1,2,3,4,5],[3,4,5,6,7],[1,2,3,4,5,6,7],"union")
+class IntersectionView(SetView):
+    """
+    The smaller operand is iterated. A view has no size, so a list operand is iterated before a view, and the first operand if both are views.
+    """
+    def __iter__(self):
+        iterated, probed = self.llist_1, self.llist_2
+        if _size(probed) < _size(iterated):
+            iterated, probed = probed, iterated
 
-#Test case 8: Intersection of two lists with overlapping elements without duplicate elements in a list
-test([1,2,3,4,5],[3,4,5,6,7],[5,4,3],"intersection")
+        for value in iterated:
+            if value in probed:
+                yield value
 
-#------------------------------------------------------------------------
+    def __contains__(self, item):
+        return item in self.llist_1 and item in self.llist_2
+
+def lazy_union(llist_1, llist_2):
+    return UnionView(llist_1, llist_2)
+
+def lazy_intersection(llist_1, llist_2):
+    return IntersectionView(llist_1, llist_2)
+
+def benchmark_set_algebra(large_size=1_000_000, ratios=(1, 100, 10_000, 1_000_000)):
+    """
+    Prints and returns the seconds taken (lower is better) by union and intersection of a list with large_size values and a list that is ratio times smaller, compared with appending value by value.
+    The n-ary functions are timed on three lists - the two above and another list with large_size values that half overlaps the first one.
+    """
+    def looped_union(llist_1, llist_2):
+        union_list = LinkedListSet()
+        for each_list in [llist_1, llist_2]:
+            for value in each_list:
+                union_list.append(value)
+        return union_list
+
+    def looped_intersection(llist_1, llist_2):
+        intersection_list = LinkedListSet()
+        for value in llist_1:
+            if value in llist_2:
+                intersection_list.append(value)
+        return intersection_list
+
+    large = LinkedListSet.from_iterable(range(large_size))
+    shifted = LinkedListSet.from_iterable(range(large_size // 2, large_size + large_size // 2))
+
+    results = dict()
+    for ratio in ratios:
+        small = LinkedListSet.from_iterable(range(0, large_size, ratio))
+
+        for name, operation in [("union", union), ("looped union", looped_union),
+                                ("intersection", intersection), ("looped intersection", looped_intersection)]:
+            start = time.perf_counter()
+            operation(large, small)
+            results[f"{name} 1:{ratio} seconds"] = time.perf_counter() - start
+
+        for name, operation, llists in [("union_all", union_all, (large, small, shifted)),
+                                        ("intersection_all", intersection_all, (large, small, shifted)),
+                                        ("difference_all large first", difference_all, (large, small, shifted)),
+                                        ("difference_all small first", difference_all, (small, large, shifted))]:
+            start = time.perf_counter()
+            operation(*llists)
+            results[f"{name} 1:{ratio} seconds"] = time.perf_counter() - start
+
+    for name, seconds in results.items():
+        print(f"{name}: {seconds:.4f}")
+    return results
+
+# Uncomment below function call to benchmark set algebra on lists of skewed sizes.
+# benchmark_set_algebra()
+
+def compare_memory(size=1_000_000):
+    """
+    Prints and returns the bytes per element, measured with tracemalloc, of a LinkedListSet and a CompactLinkedListSet holding size integer ids.
+    The integers are created before measuring, so only the structures holding them are counted.
+    """
+    values = list(range(size))
+    results = dict()
+    for list_class in [LinkedListSet, CompactLinkedListSet]:
+        tracemalloc.start()
+        llist = list_class.from_iterable(values)
+        bytes_used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del llist
+        results[list_class.__name__] = bytes_used / size
+
+    for name, bytes_per_element in results.items():
+        print(f"{name}: {bytes_per_element:.1f} bytes/element")
+    return results
+
+# Uncomment below function call to compare the memory used by LinkedListSet and CompactLinkedListSet.
+# compare_memory()
+
+def benchmark_from_iterable(sizes=(1_000, 10_000, 100_000, 1_000_000, 10_000_000)):
+    """
+    Prints and returns the items/sec of building a LinkedListSet from size values (half of them duplicates) with looped append(), with from_iterable(), and from a numpy array if numpy is installed.
+    """
+    results = dict()
+    for size in sizes:
+        values = list(range(size // 2)) * 2
+        builders = {
+            "append": lambda: _append_all(LinkedListSet(), values),
+            "from_iterable": lambda: LinkedListSet.from_iterable(values),
+            "compact from_iterable": lambda: CompactLinkedListSet.from_iterable(values),
+        }
+        if np is not None:
+            array_values = np.array(values)
+            builders["from_iterable numpy"] = lambda: LinkedListSet.from_iterable(array_values)
+
+        for name, build in builders.items():
+            start = time.perf_counter()
+            build()
+            results[f"{name} {size}"] = size / (time.perf_counter() - start)
+
+    for name, items_per_sec in results.items():
+        print(f"{name}: {items_per_sec:,.0f} items/sec")
+    return results
+
+def _append_all(llist, values):
+    for value in values:
+        llist.append(value)
+    return llist
+
+# Uncomment below function call to benchmark bulk construction.
+# benchmark_from_iterable()
+        
+def test(list1, list2, expected_list, operation, debug=False):
+    llist1 = LinkedListSet.from_iterable(list1)
+    llist2 = LinkedListSet.from_iterable(list2)
 
-#Test case 9: Union of two lists with overlapping elements with duplicate elements in a list
-test([1,1,2,3,4,5,5],[3,3,4,5,6,6,7],[1,2,3,4,5,6,7],"union")
+    if operation == "union" :
+        assert sorted(union(llist1, llist2).to_list()) == sorted(expected_list)
+        if debug: print(f"Expected: {expected_list}. Actual: {union(llist1, llist2).to_list()}")
+    elif operation == "intersection":
+        assert sorted(intersection(llist1, llist2).to_list()) == sorted(expected_list)
+        if debug: print(f"Expected: {expected_list}. Actual: {intersection(llist1, llist2).to_list()}")
+    else:
+        raise Exception("Operation not recognized")
 
-#Test case 10: Intersection of two lists with overlapping elements with duplicate elements in a list
-test([1,1,2,3,4,5,5],[3,3,4,5,6,6,7],[5,4,3],"intersection")
\ No newline at end of file
+    
+    
+if __name__ == "__main__":
+    #Test case 1: Union of 2 empty llists is an empty list
+    test([],[],[],"union")
+
+    #Test case 2: Intersection of 2 empty llists is an empty list
+    test([],[],[],"intersection")
+
+    #------------------------------------------------------------------------
+
+    #Test case 3: Union of two lists with one distinct element each
+    test([1],[2],[1,2],"union")
+
+    #Test case 4: Intersection of two lists with one distinct element each
+    test([1],[2],[],"intersection")
+
+    #------------------------------------------------------------------------
+
+    #Test case 5: Union of two lists with several distinct elements each
+    test([1,2,3,4],[5,6,7],[1,2,3,4,5,6,7],"union")
+
+    #Test case 6: Intersection of two lists with several distinct elements each
+    test([1,2,3,4],[5,6,7],[],"intersection")
+
+    #------------------------------------------------------------------------
+
+    #Test case 7: Union of two lists with overlapping elements without duplicate elements in a list
+    test([1,2,3,4,5],[3,4,5,6,7],[1,2,3,4,5,6,7],"union")
+
+    #Test case 8: Intersection of two lists with overlapping elements without duplicate elements in a list
+    test([1,2,3,4,5],[3,4,5,6,7],[5,4,3],"intersection")
+
+    #------------------------------------------------------------------------
+
+    #Test case 9: Union of two lists with overlapping elements with duplicate elements in a list
+    test([1,1,2,3,4,5,5],[3,3,4,5,6,6,7],[1,2,3,4,5,6,7],"union")
+
+    #Test case 10: Intersection of two lists with overlapping elements with duplicate elements in a list
+    test([1,1,2,3,4,5,5],[3,3,4,5,6,6,7],[5,4,3],"intersection")
+
+    #------------------------------------------------------------------------
+
+    #Test case 11: Union, intersection and difference of several lists with overlapping elements
+    llists = [LinkedListSet.from_iterable([1,2,3,4,5]), LinkedListSet.from_iterable([3,4,5,6]), LinkedListSet.from_iterable([4,5,6,7,7])]
+    assert sorted(union_all(*llists).to_list()) == [1,2,3,4,5,6,7]
+    assert sorted(intersection_all(*llists).to_list()) == [4,5]
+    assert sorted(difference_all(*llists).to_list()) == [1,2]
+    assert union_all(*llists).size() == 7
+
+    #Test case 12: Set algebra links the result in the order of the operands, the same as appending the values one by one, so the order does not depend on the hash seed. This matches the order of the original union and intersection.
+    first, second = LinkedListSet.from_iterable(["w", "x", "y"]), LinkedListSet.from_iterable(["y", "z", "x"])
+    assert first.to_list() == ["y", "x", "w"] and second.to_list() == ["x", "z", "y"]
+    assert union(first, second).to_list() == ["z", "w", "x", "y"]
+    assert intersection(first, second).to_list() == ["x", "y"]
+    assert intersection(second, first).to_list() == ["y", "x"] # Both have the same size, so the first list is iterated
+    assert difference_all(first, second).to_list() == ["w"]
+    assert union(CompactLinkedListSet.from_iterable(["w", "x", "y"]), second).to_list() == ["z", "w", "x", "y"]
+
+    #Test case 13: Intersection iterates the smaller list, so the order of the operands does not matter
+    assert sorted(intersection(LinkedListSet.from_iterable(range(1000)), LinkedListSet.from_iterable([5,500,5000])).to_list()) == [5,500]
+    assert sorted(intersection(LinkedListSet.from_iterable([5,500,5000]), LinkedListSet.from_iterable(range(1000))).to_list()) == [5,500]
+
+    #Test case 14: Set algebra with a single list, no lists, and an empty list
+    assert sorted(union_all(LinkedListSet.from_iterable([1,2])).to_list()) == [1,2]
+    assert union_all().to_list() == []
+    assert intersection_all().to_list() == []
+    assert intersection_all(LinkedListSet.from_iterable([1,2]), LinkedListSet.from_iterable([])).to_list() == []
+    assert sorted(difference_all(LinkedListSet.from_iterable([1,2]), LinkedListSet.from_iterable([])).to_list()) == [1,2]
+    assert difference_all(LinkedListSet.from_iterable([]), LinkedListSet.from_iterable([1,2])).to_list() == []
+
+    #Test case 15: Iterating a list inside a loop over the same list gives each loop its own cursor
+    llist = LinkedListSet.from_iterable([1,2,3])
+    assert [(outer, inner) for outer in llist for inner in llist] == [(outer, inner) for outer in [3,2,1] for inner in [3,2,1]]
+    iterator_1, iterator_2 = iter(llist), iter(llist)
+    assert next(iterator_1) == 3 and next(iterator_1) == 2
+    assert next(iterator_2) == 3
+
+    #Test case 16: Lazy union and intersection views can be nested, support `in`, and give the same values as the eager functions
+    a, b, c = LinkedListSet.from_iterable([1,2,3,4,5]), LinkedListSet.from_iterable([4,5,6]), LinkedListSet.from_iterable([1,6,7])
+    pipeline = lazy_intersection(a, lazy_union(b, c))
+    assert sorted(pipeline.to_list()) == sorted(intersection(a, union(b, c)).to_list()) == [1,4,5]
+    assert 4 in pipeline and 1 in pipeline
+    assert 6 not in pipeline and 2 not in pipeline
+    assert sorted(lazy_union(a, b).to_list()) == [1,2,3,4,5,6]
+    assert sorted(lazy_intersection(b, a).to_list()) == [4,5]
+    assert lazy_union(LinkedListSet.from_iterable([]), LinkedListSet.from_iterable([])).to_list() == []
+
+    #Test case 17: The eager functions accept views as operands, mixed with lists, and return a list
+    mixed = intersection(a, lazy_union(a, a))
+    assert isinstance(mixed, LinkedListSet)
+    assert mixed.to_list() == intersection(a, a).to_list() == [1,2,3,4,5]
+    assert intersection(a, lazy_union(b, c)).to_list() == intersection(a, union(b, c)).to_list() == [1,4,5]
+    assert sorted(union(lazy_intersection(a, b), c).to_list()) == [1,4,5,6,7]
+    assert isinstance(union(lazy_intersection(a, b), c), LinkedListSet)
+    assert sorted(intersection_all(lazy_union(a, b), lazy_union(b, c), a).to_list()) == [1,4,5]
+    assert sorted(difference_all(a, lazy_union(b, c)).to_list()) == [2,3]
+    assert sorted(difference_all(lazy_union(a, b), lazy_intersection(a, b), c).to_list()) == [2,3]
+    assert isinstance(intersection(CompactLinkedListSet.from_iterable([1,2]), lazy_union(a, b)), CompactLinkedListSet)
+
+    #Test case 18: CompactLinkedListSet supports the same API as LinkedListSet, and iterates in the same order
+    compact = CompactLinkedListSet()
+    for value in [1,1,2,3,2]:
+        compact.append(value)
+    assert compact.size() == 3
+    assert 2 in compact and 4 not in compact
+    assert compact.to_list() == LinkedListSet.from_iterable([1,1,2,3,2]).to_list() == [3,2,1]
+    assert str(compact) == "3 -> 2 -> 1"
+
+    #Test case 19: Set algebra and lazy views work on CompactLinkedListSet, and mixed with LinkedListSet
+    compact_union = union(CompactLinkedListSet.from_iterable([1,2,3]), LinkedListSet.from_iterable([3,4]))
+    assert isinstance(compact_union, CompactLinkedListSet)
+    assert sorted(compact_union.to_list()) == [1,2,3,4]
+    assert sorted(intersection(LinkedListSet.from_iterable([1,2,3]), CompactLinkedListSet.from_iterable(range(100))).to_list()) == [1,2,3]
+    assert sorted(intersection_all(CompactLinkedListSet.from_iterable(range(100)), LinkedListSet.from_iterable([5,6]), CompactLinkedListSet.from_iterable([6,7])).to_list()) == [6]
+    assert sorted(difference_all(LinkedListSet.from_iterable([1,2,3]), CompactLinkedListSet.from_iterable([2]), CompactLinkedListSet.from_iterable(range(3, 100))).to_list()) == [1]
+    assert sorted(lazy_intersection(CompactLinkedListSet.from_iterable([1,2,3]), lazy_union(LinkedListSet.from_iterable([2]), CompactLinkedListSet.from_iterable([3]))).to_list()) == [2,3]
+
+    #Test case 20: extend() skips values that are already in the list and duplicates within the batch, in the same order as append()
+    llist = LinkedListSet.from_iterable([1,2])
+    llist.extend([2,3,3,4,1])
+    assert llist.to_list() == _append_all(LinkedListSet(), [1,2,2,3,3,4,1]).to_list() == [4,3,2,1]
+    assert llist.size() == 4
+    llist.extend([])
+    assert llist.size() == 4
+
+    compact = CompactLinkedListSet.from_iterable([1,2])
+    compact.extend(x for x in [2,3,3,4,1])
+    assert compact.to_list() == [4,3,2,1]
+
+    #Test case 21: A numpy array is deduplicated with np.unique and stored as python numbers
+    if np is not None:
+        llist = LinkedListSet.from_iterable(np.array([3,1,3,2,1]))
+        assert sorted(llist.to_list()) == [1,2,3]
+        assert all(type(value) is int for value in llist)
+        llist.extend(np.array([2,5]))
+        assert sorted(llist.to_list()) == [1,2,3,5]
+        assert sorted(CompactLinkedListSet.from_iterable(np.array([3,1,3])).to_list()) == [1,3]
\ No newline at end of file